@@ -3,7 +3,7 @@
 ##############################################################################
 # Python imports.
 from pathlib    import Path
-from setuptools import setup, find_packages
+from setuptools import setup
 
 ##############################################################################
 # Import the library itself to pull details out of it.
@@ -44,9 +44,8 @@ setup(
     author_email                  = unbored.__email__,
     maintainer                    = unbored.__maintainer__,
     maintainer_email              = unbored.__email__,
-    packages                      = find_packages(),
+    packages                      = [ "unbored" ],
     package_data                  = { "unbored": [ "py.typed", "unbored.css" ] },
-    include_package_data          = True,
     install_requires              = [ "textual==0.32.0", "bored-api", "xdg" ],
     python_requires               = ">=3.10",
     keywords                      = "todo fun inspiration api-client terminal textual",
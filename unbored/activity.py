@@ -2,10 +2,8 @@
 
 ##############################################################################
 # Python imports.
-from typing      import Any, cast
+from typing      import Any, Callable, Final, cast
 from datetime    import datetime
-from dataclasses import asdict
-from webbrowser  import open as open_url
 
 ##############################################################################
 # BoredAPI imports.
@@ -23,12 +21,22 @@ from textual.events     import MouseDown
 
 ##############################################################################
 # Rich imports.
-from rich.text import Text
+from rich.console import Group
+from rich.text    import Text
 
 ##############################################################################
 # Local imports.
 from .focus_within import focus_within
 
+##############################################################################
+# The labels for the buttons on an activity. These are the same for every
+# activity, and Button doesn't modify its label, so they can be parsed once
+# and shared.
+_LINK_LABEL: Final   = Text.from_markup( ":link:" )
+_UP_LABEL: Final     = Text.from_markup( ":up_arrow:" )
+_DOWN_LABEL: Final   = Text.from_markup( ":down_arrow:" )
+_DELETE_LABEL: Final = Text.from_markup( ":cross_mark:" )
+
 ##############################################################################
 class WebLink( Button ):
     """A button that links to a URL."""
@@ -36,10 +44,13 @@ class WebLink( Button ):
     def __init__( self, link: str ) -> None:
         """Initialise the link button."""
         self._link = link
-        super().__init__( Text.from_markup( ":link:" ), variant="primary" )
+        super().__init__( _LINK_LABEL, variant="primary" )
 
     def visit( self ) -> None:
         """Visit the URL for the link."""
+        # webbrowser drags in a fair bit of the standard library, and most
+        # of the time we'll never need it, so only import it on demand.
+        from webbrowser import open as open_url # pylint:disable=import-outside-toplevel
         open_url( self._link )
 
 ##############################################################################
@@ -64,11 +75,31 @@ class Activity( Widget ):
         super().__init__()
         self.activity  = activity
         self.chosen_at = datetime.now() if chosen_at is None else chosen_at
+        # The activity doesn't change once it has been chosen, so we can
+        # build the data we save, and the text we display, just the once.
+        self._as_dict     = { **vars( activity ), "chosen_at": self.chosen_at.isoformat() }
+        self._timestamp   = self.chosen_at.strftime( '%c' )
+        self._description = (
+            f"[b]{activity.activity}[/b]\n\n"
+            f"It's considered to have an accessibility of score of {activity.accessibility}"
+            " (0 being the most accessible; 1 being the least), "
+            f"is a {activity.type.value} type of activity, "
+            + (
+                f"requires {activity.participants} participants "
+                if activity.participants > 1 else ""
+            ) +
+            f"and has a price score of {activity.price} (0 being free)."
+        )
 
     @property
     def as_dict( self ) -> dict[ str, Any ]:
-        """The activity as a dictionary."""
-        return asdict( self.activity ) | { "chosen_at": self.chosen_at }
+        """The activity as a dictionary.
+
+        Note:
+            The same dictionary is returned each time, so it should be
+            treated as read-only.
+        """
+        return self._as_dict
 
     @staticmethod
     def from_dict( activity: dict[ str, Any ] ) -> "Activity":
@@ -87,12 +118,12 @@ class Activity( Widget ):
     @property
     def is_first( self ) -> bool:
         """Is this the first activity in the activity list?"""
-        return self.parent is not None and self.parent.children[ 0 ] == self
+        return self.parent is not None and self.parent.children[ 0 ] is self
 
     @property
     def is_last( self ) -> bool:
         """Is this the last activity in the activity list?"""
-        return self.parent is not None and self.parent.children[ -1 ] == self
+        return self.parent is not None and self.parent.children[ -1 ] is self
 
     class Moved( Message ):
         """A message to indicate that an activity has moved."""
@@ -101,18 +132,19 @@ class Activity( Widget ):
         """Move this activity up one place in the list."""
         if self.parent is not None and not self.is_first:
             parent = cast( Widget, self.parent )
-            parent.move_child(
-                self, before=parent.children.index( self ) - 1
-            )
+            # Note that the move is done by index, so that the parent doesn't
+            # have to go looking for us in its children a second time.
+            location = parent.children.index( self )
+            parent.move_child( location, before=location - 1 )
             self.post_message( self.Moved() )
             self.scroll_visible()
 
     def action_move_down( self ) -> None:
         """Move this activity up down place in the list."""
         if self.parent is not None and not self.is_last:
-            cast( Widget, self.parent ).move_child(
-                self, after=self.parent.children.index( self ) + 1
-            )
+            parent = cast( Widget, self.parent )
+            location = parent.children.index( self )
+            parent.move_child( location, after=location + 1 )
             self.post_message( self.Moved() )
             self.scroll_visible()
 
@@ -122,55 +154,68 @@ class Activity( Widget ):
         Returns:
             The layout for the main screen.
         """
-        yield Static( self.chosen_at.strftime( '%c' ), classes="timestamp" )
-        yield Static(
-            f"[b]{self.activity.activity}[/b]\n\n"
-            f"It's considered to have an accessibility of score of {self.activity.accessibility}"
-            " (0 being the most accessible; 1 being the least), "
-            f"is a {self.activity.type.value} type of activity, "
-            + (
-                f"requires {self.activity.participants} participants "
-                if self.activity.participants > 1 else ""
-            ) +
-            f"and has a price score of {self.activity.price} (0 being free)."
+
+        # Keep hold of the first button, it's the one that gets focus when
+        # the user clicks in the activity.
+        # pylint:disable=attribute-defined-outside-init
+        self._first_button = Button(
+            _UP_LABEL,
+            id="up", classes="mover", variant="primary"
         )
+
+        # Note that the timestamp and the description go in the one
+        # Static, rather than having a widget apiece.
+        yield Static( Group(
+            Text( self._timestamp, style="italic", justify="right" ),
+            Text.from_markup( self._description )
+        ) )
         with Horizontal( classes="buttons" ):
+            yield self._first_button
             yield Button(
-                Text.from_markup( ":up_arrow:" ),
-                id="up", classes="mover", variant="primary"
-            )
-            yield Button(
-                Text.from_markup( ":down_arrow:" ),
+                _DOWN_LABEL,
                 id="down", classes="mover", variant="primary"
             )
             if self.activity.link:
                 yield WebLink( link=self.activity.link )
             yield Button(
-                Text.from_markup( ":cross_mark:" ),
+                _DELETE_LABEL,
                 id="delete", variant="primary"
             )
 
     class Dropped( Message ):
         """A message to indicate that an activity was dropped."""
 
+        def __init__( self, activity: "Activity" ) -> None:
+            """Initialise the message.
+
+            Args:
+                activity: The activity that was dropped.
+            """
+            super().__init__()
+            self.activity = activity
+            """The activity that was dropped."""
+
     def drop_activity( self ) -> None:
         """Drop the current activity, letting the parent know we're doing so."""
-        self.post_message( self.Dropped() )
+        self.post_message( self.Dropped( self ) )
         # Note that I delay the self-remove because, right now anyway, if I
         # do this without delaying it the above message won't make it out.
         #
         # See https://github.com/Textualize/textual/issues/2017
         self.call_after_refresh( self.remove )
 
+    _BUTTON_ACTIONS: Final[ dict[ str, Callable[ [ "Activity" ], None ] ] ] = {
+        "delete": drop_activity,
+        "up":     action_move_up,
+        "down":   action_move_down
+    }
+    """The methods that handle the buttons, keyed by the button's ID."""
+
     async def on_button_pressed( self, event: Button.Pressed ) -> None:
         """React to a button being pressed on the widget."""
         event.stop()
-        if event.button.id == "delete":
-            self.drop_activity()
-        elif event.button.id == "up":
-            self.action_move_up()
-        elif event.button.id == "down":
-            self.action_move_down()
+        if ( action := self._BUTTON_ACTIONS.get( event.button.id or "" ) ) is not None:
+            action( self )
         elif isinstance( event.button, WebLink ):
             event.button.visit()
 
@@ -181,7 +226,7 @@ class Activity( Widget ):
     def on_mouse_down( self, _: MouseDown ) -> None:
         """React to the mouse button going down within us."""
         if not focus_within( self ):
-            self.query( Button ).first().focus()
+            self._first_button.focus()
             self.scroll_visible()
 
     class Deselect( Message ):
@@ -35,7 +35,7 @@ class FilterInput( Input ):
             The acceptable value.
         """
         # If the input field isn't empty...
-        if value.strip():
+        if value and not value.isspace():
             try:
                 # ...run it through the casting function. We don't care
                 # about what comes out of the other end, we just case that
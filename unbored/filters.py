@@ -2,13 +2,13 @@
 
 ##############################################################################
 # Python imports.
-from typing import TypeVar
+from typing import Any
 
 ##############################################################################
 # Textual imports.
 from textual.app        import ComposeResult
 from textual.binding    import Binding
-from textual.widgets    import Label
+from textual.widgets    import Label, Input
 from textual.containers import VerticalScroll
 from textual.message    import Message
 from textual.events     import DescendantBlur
@@ -18,6 +18,27 @@ from textual.events     import DescendantBlur
 from .focus_within import focus_within
 from .filter_input import FilterInput, IntInput, FloatInput
 
+##############################################################################
+def _clamp01( value: float | None ) -> float | None:
+    """Clamp a value to the range 0 to 1.
+
+    Args:
+        value: The value to clamp.
+
+    Returns:
+        The clamped value.
+
+    Note:
+        If the value is `None`, then `None` will be returned.
+    """
+    if value is None:
+        return value
+    if value < 0.0:
+        return 0.0
+    if value > 1.0:
+        return 1.0
+    return value
+
 ##############################################################################
 class Filters( VerticalScroll, can_focus=False ):
     """Filtering sidebar."""
@@ -27,23 +48,62 @@ class Filters( VerticalScroll, can_focus=False ):
     ]
     """The bindings for the filter pop-over."""
 
+    def __init__( self, *args: Any, **kwargs: Any ) -> None:
+        """Initialise the filters."""
+        super().__init__( *args, **kwargs )
+        self._range_cache: dict[ str, tuple[ float | None, float | None ] ] = {}
+        """Cache of min/max filter values, keyed by the name of the filter."""
+        self._edited = False
+        """Has the user ever edited any of the filters?"""
+
     def compose( self ) -> ComposeResult:
         """Compose the filter panel.
 
         Returns:
             The layout for the filters panel.
         """
+
+        # Keep hold of the inputs so we can get at their values without
+        # needing to query for them.
+        # pylint:disable=attribute-defined-outside-init
+        self._participants = IntInput(
+            id="participants", placeholder="Number of participants"
+        )
+        min_price = FloatInput(
+            id="min_price", placeholder="Between 0 (free) and 1 (expensive)"
+        )
+        max_price = FloatInput(
+            id="max_price", placeholder="Between 0 (free) and 1 (expensive)"
+        )
+        min_accessibility = FloatInput(
+            id="min_accessibility", placeholder="Between 0 (most) and 1 (least)"
+        )
+        max_accessibility = FloatInput(
+            id="max_accessibility", placeholder="Between 0 (most) and 1 (least)"
+        )
+        self._ranges = {
+            "price":         ( min_price, max_price ),
+            "accessibility": ( min_accessibility, max_accessibility )
+        }
+        self._inputs: tuple[ FilterInput, ... ] = (
+            self._participants,
+            min_price,
+            max_price,
+            min_accessibility,
+            max_accessibility
+        )
+
         yield Label( "Filters", classes="h1" )
         yield Label( "Participants:", classes="h2" )
-        yield IntInput( id="participants", placeholder="Number of participants" )
+        yield self._participants
         yield Label( "Minimum Price:", classes="h2" )
-        yield FloatInput( id="min_price", placeholder="Between 0 (free) and 1 (expensive)" )
+        yield min_price
         yield Label( "Maximum Price:", classes="h2" )
-        yield FloatInput( id="max_price", placeholder="Between 0 (free) and 1 (expensive)" )
+        yield max_price
         yield Label( "Minimum Accessibility:", classes="h2" )
-        yield FloatInput( id="min_accessibility", placeholder="Between 0 (most) and 1 (least)" )
+        yield min_accessibility
         yield Label( "Maximum Accessibility:", classes="h2" )
-        yield FloatInput( id="max_accessibility", placeholder="Between 0 (most) and 1 (least)" )
+        yield max_accessibility
 
     def on_descendant_blur( self, _: DescendantBlur ) -> None:
         """Watch and handle focus changes in the inputs."""
@@ -52,9 +112,20 @@ class Filters( VerticalScroll, can_focus=False ):
             # ...auto-close.
             self.hide()
 
+    def on_input_changed( self, _: Input.Changed ) -> None:
+        """Forget any filter values we've worked out when an input changes."""
+        self._edited = True
+        self._range_cache.clear()
+
     def on_mount( self ) -> None:
         """Configure the filters once we're composed."""
-        self.hide()
+        if self.shown:
+            self.hide()
+        else:
+            # We're starting out hidden, so make sure none of the inputs
+            # can be tabbed into.
+            for field in self._inputs:
+                field.can_focus = False
 
     @property
     def participants( self ) -> int | None:
@@ -63,39 +134,15 @@ class Filters( VerticalScroll, can_focus=False ):
         If the user appears to have provided a value, it will be an integer.
         If there is no given value or it doesn't look this will be `None`.
         """
+        if not self._edited or not ( participants := self._participants.value.strip() ):
+            return None
         try:
-            if ( value := int( self.query_one( "#participants", IntInput ).value.strip() ) ) > 0:
+            if ( value := int( participants ) ) > 0:
                 return value
         except ValueError:
             pass
         return None
 
-    TClamp = TypeVar( "TClamp", int, float )
-    """A clampable type."""
-
-    @staticmethod
-    def clamp( value: TClamp | None, min_val : TClamp, max_val: TClamp ) -> TClamp | None:
-        """Clamp a value.
-
-        Args:
-            value: The value to clamp.
-            min_val: The minimum value.
-            max_val: The maximum value.
-
-        Returns:
-            The clamped value.
-
-        Note:
-            If the value is `None`, then `None` will be returned.
-        """
-        if value is None:
-            return value
-        if value < min_val:
-            return min_val
-        if value > max_val:
-            return max_val
-        return value
-
     def _min_max_value( self, value: str ) -> tuple[ float | None, float | None ]:
         """Get a min/max float value from the filters.
 
@@ -105,25 +152,40 @@ class Filters( VerticalScroll, can_focus=False ):
         Returns:
             The filter value.
         """
-        def _value( which: str ) -> float | None:
+
+        # If the user has never touched the filters there's nothing to work
+        # out.
+        if not self._edited:
+            return None, None
+
+        # If we've already worked this out, and none of the inputs have
+        # changed since, there's no need to do it all again.
+        if ( cached := self._range_cache.get( value ) ) is not None:
+            return cached
+
+        def _value( field: FloatInput ) -> float | None:
+            # An empty input is the common case, so don't even try and
+            # parse that.
+            if not ( text := field.value.strip() ):
+                return None
             try:
-                if ( price := float(
-                        self.query_one( f"#{which}_{value}", FloatInput ).value.strip()
-                ) ) <= 0:
+                if ( price := float( text ) ) <= 0:
                     price = None
             except ValueError:
                 price = None
             return price
 
         # Get the filter values.
-        min_value = self.clamp( _value( "min" ), 0, 1 )
-        max_value = self.clamp( _value( "max" ), 0, 1 )
+        min_input, max_input = self._ranges[ value ]
+        min_value = _clamp01( _value( min_input ) )
+        max_value = _clamp01( _value( max_input ) )
 
         # Let's be nicer to a confused user, I guess.
         if min_value is not None and max_value is not None and max_value < min_value:
-            return max_value, min_value
+            min_value, max_value = max_value, min_value
 
-        # Finally, return what we've got.
+        # Finally, remember and return what we've got.
+        self._range_cache[ value ] = ( min_value, max_value )
         return min_value, max_value
 
     @property
@@ -145,6 +207,24 @@ class Filters( VerticalScroll, can_focus=False ):
         """
         return self._min_max_value( "accessibility" )
 
+    def as_api_options( self ) -> dict[ str, Any ]:
+        """Get the filters as options for the Bored API.
+
+        Returns:
+            The options for all of the filters that have a value.
+        """
+        min_price, max_price = self.price
+        min_accessibility, max_accessibility = self.accessibility
+        return {
+            option: value for option, value in (
+                ( "participants", self.participants ),
+                ( "min_price", min_price ),
+                ( "max_price", max_price ),
+                ( "min_accessibility", min_accessibility ),
+                ( "max_accessibility", max_accessibility )
+            ) if value is not None
+        }
+
     def action_close( self ) -> None:
         """Close action for the filters."""
         self.hide()
@@ -154,9 +234,11 @@ class Filters( VerticalScroll, can_focus=False ):
 
     def show( self ) -> None:
         """Show the filter options."""
-        for field in self.query( FilterInput ):
+        if self.shown:
+            return
+        for field in self._inputs:
             field.can_focus = True
-        self.query( FilterInput ).first().focus()
+        self._inputs[ 0 ].focus()
         self.remove_class( "hidden" )
         self.post_message( self.Shown() )
 
@@ -165,8 +247,10 @@ class Filters( VerticalScroll, can_focus=False ):
 
     def hide( self ) -> None:
         """Hide the filter options."""
+        if not self.shown:
+            return
         self.add_class( "hidden" )
-        for field in self.query( FilterInput ):
+        for field in self._inputs:
             field.can_focus = False
         self.post_message( self.Hidden() )
 
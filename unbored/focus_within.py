@@ -2,6 +2,7 @@
 
 ##############################################################################
 # Textual imports.
+from textual.dom    import DOMNode, NoScreen
 from textual.widget import Widget
 
 ##############################################################################
@@ -14,6 +15,19 @@ def focus_within( widget: Widget ) -> bool:
     Returns:
         `True` if focus is within the widget, otherwise `False`.
     """
-    return bool( widget.query( "*:focus-within" ) )
+    try:
+        focused = widget.screen.focused
+    except NoScreen:
+        return False
+    # Rather than query the widget's descendants for one with focus, we walk
+    # up from the focused widget looking for the widget we were given. Note
+    # that we start from the parent of the focused widget; the widget itself
+    # having focus doesn't count as focus being *within* it.
+    node: DOMNode | None = None if focused is None else focused.parent
+    while node is not None:
+        if node is widget:
+            return True
+        node = node.parent
+    return False
 
 ### focus_within.py ends here
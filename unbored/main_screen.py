@@ -2,7 +2,7 @@
 
 ##############################################################################
 # Python imports.
-from typing      import Final, Any
+from typing      import Final, Any, Callable
 from pathlib     import Path
 from dataclasses import is_dataclass, asdict
 from json        import JSONEncoder, dumps, loads
@@ -22,7 +22,8 @@ from textual.app        import ComposeResult
 from textual.screen     import Screen
 from textual.binding    import Binding
 from textual.widgets    import Header, Footer, Button
-from textual.containers import Vertical, VerticalScroll
+from textual.containers import VerticalScroll
+from textual.timer      import Timer
 
 ##############################################################################
 # Local imports.
@@ -30,22 +31,30 @@ from .type_choices import TypeChoices
 from .filters      import Filters
 from .activity     import Activity
 
+##############################################################################
+_ACTIVITY_TYPES: Final = { activity_type.value: activity_type for activity_type in ActivityType }
+"""Map of saved activity type values to their activity types."""
+
 ##############################################################################
 class ActivityEncoder( JSONEncoder ):
     """JSON encoder that understands about activities."""
 
+    _ENCODERS: Final[ dict[ type, Callable[ [ Any ], Any ] ] ] = {
+        ActivityType: lambda activity_type: activity_type.value,
+        datetime:     datetime.isoformat
+    }
+    """Encoders for the types we know about, keyed by the type."""
+
     def default( self, o: object ) -> Any:
         """Handle unknown values."""
+        if ( encoder := self._ENCODERS.get( type( o ) ) ) is not None:
+            return encoder( o )
         if is_dataclass( o ):
             return asdict( o )
-        if isinstance( o, ActivityType ):
-            return o.value
-        if isinstance( o, datetime ):
-            return o.isoformat()
         return super().default( o )
 
 ##############################################################################
-class Main( Screen ):
+class Main( Screen ): # pylint:disable=too-many-instance-attributes
     """The main application screen."""
 
     BINDINGS = [
@@ -55,6 +64,18 @@ class Main( Screen ):
     ]
     """The bindings for the main screen."""
 
+    def __init__( self, *args: Any, **kwargs: Any ) -> None:
+        """Initialise the main screen."""
+        super().__init__( *args, **kwargs )
+        self._unsaved: list[ dict[ str, Any ] ] | None = None
+        """The activity list as of the last change, if it's yet to be saved."""
+        self._save_timer: Timer | None = None
+        """The timer for the pending save, if there is one."""
+        self._data_file = xdg_data_home() / "unbored" / self.ACTIVITY_FILE
+        """The full path to the file for saving the data."""
+        self._saved_order: list[ Activity ] = []
+        """The activities, in order, as of the last save."""
+
     def compose( self ) -> ComposeResult:
         """Compose the main screen.
 
@@ -72,80 +93,93 @@ class Main( Screen ):
         self.activities.can_focus = False
 
         yield Header()
-        with Vertical():
-            yield self.choices
-            yield self.activities
-            yield self.filters
+        yield self.choices
+        yield self.activities
+        yield self.filters
         yield Footer()
 
     def on_mount( self ) -> None:
         """Set up the screen on mount."""
         self.api = BoredClient()
         self.choices.become_focused()
+        self._data_file.parent.mkdir( parents=True, exist_ok=True )
         self.load_activity_list()
 
     ACTIVITY_FILE: Final = Path( "unbored.json" )
     """The name of the file that the list it saved to."""
 
-    @property
-    def data_file( self ) -> Path:
-        """The full path to the file for saving the data.
+    SAVE_DELAY: Final = 0.5
+    """How long to wait, in seconds, after a change before saving the list."""
+
+    def _write_activity_list( self ) -> None:
+        """Write any unsaved changes to the activity list to disk."""
+        if self._unsaved is not None:
+            # Write to a working file first and then move it into place, so
+            # a failed write can't leave us with a damaged list.
+            ( working := self._data_file.with_suffix( ".tmp" ) ).write_text(
+                dumps( self._unsaved, cls=ActivityEncoder )
+            )
+            working.replace( self._data_file )
+            self._unsaved = None
+
+    def save_activity_list( self, dropped: Activity | None = None ) -> None:
+        """Save the activity list to disk.
+
+        Args:
+            dropped: An activity that's being dropped from the list.
 
         Note:
-            As a side effect of access the directory will be crated if it
-            doesn't exist.
-        """
-        ( save_to := xdg_data_home() / "unbored" ).mkdir( parents=True, exist_ok=True )
-        return save_to / self.ACTIVITY_FILE
+            The write to disk is held off for `SAVE_DELAY` seconds, so that
+            a flurry of changes results in just the one write.
 
-    def save_activity_list( self ) -> None:
-        """Save the activity list to disk."""
-        self.data_file.write_text( dumps(
-            [ activity.as_dict for activity in self.activities.query( Activity ) ],
-            cls=ActivityEncoder, indent=4
-        ) )
+            If the activities are the same, and in the same order, as they
+            were at the last save, no save is made.
+        """
+        # Note that activities are only ever mounted directly into the
+        # activity list, so there's no need to query the whole DOM below it.
+        # Also note that a dropped activity will likely still be in the list
+        # at this point, so we leave it out by hand.
+        activities = [
+            activity for activity in self.activities.children
+            if isinstance( activity, Activity ) and activity is not dropped
+        ]
+        if activities == self._saved_order:
+            return
+        self._saved_order = activities
+        self._unsaved     = [ activity.as_dict for activity in activities ]
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer( self.SAVE_DELAY, self._write_activity_list )
+
+    def on_unmount( self ) -> None:
+        """Ensure any pending save happens before the screen goes away."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._write_activity_list()
 
     def load_activity_list( self ) -> None:
         """Load the activity list from disk."""
-        if self.data_file.exists():
+        if self._data_file.exists():
             to_mount: list[ Activity ] = []
-            for activity in loads( self.data_file.read_text() ):
-                activity[ "type" ] = ActivityType( activity[ "type" ] )
+            for activity in loads( self._data_file.read_text() ):
+                activity[ "type" ] = _ACTIVITY_TYPES[ activity[ "type" ] ]
                 to_mount.append( Activity.from_dict( activity ) )
             if to_mount:
                 self.activities.mount( *to_mount )
+            self._saved_order = to_mount
 
     async def on_button_pressed( self, event: Button.Pressed ) -> None:
         """Handle the button press."""
 
-        # We're going to build up a collection of options to dictate the
-        # choice made.
-        options: dict[ str, Any ] = {}
+        # The options that dictate the choice made start out with whatever
+        # the user has asked for in the filters.
+        options = self.filters.as_api_options()
 
         # If the button wasn't the any button, it'll have been one of the
         # activity type buttons. The filter value is in the button ID.
         if event.button.id is not None and event.button.id != "any":
             options[ "type" ] = event.button.id
 
-        # If it looks like we've got a participants filter...
-        if ( participants := self.filters.participants ) is not None:
-            # ...add that.
-            options[ "participants" ] = participants
-
-        # See if we should apply price filtering.
-        min_price, max_price = self.filters.price
-        if min_price is not None:
-            options[ "min_price" ] = min_price
-        if max_price is not None:
-            options[ "max_price" ] = max_price
-
-        # See if we should apply accessibility filtering.
-        min_accessibility, max_accessibility = self.filters.accessibility
-        if min_accessibility is not None:
-            options[ "min_accessibility" ] = min_accessibility
-        if max_accessibility is not None:
-            options[ "max_accessibility" ] = max_accessibility
-
         # Get the new activity.
         try:
             await self.activities.mount(
@@ -173,9 +207,9 @@ class Main( Screen ):
         """React to an activity being moved."""
         self.save_activity_list()
 
-    def on_activity_dropped( self, _: Activity.Dropped ) -> None:
+    def on_activity_dropped( self, event: Activity.Dropped ) -> None:
         """React to an activity being dropped."""
-        self.save_activity_list()
+        self.save_activity_list( event.activity )
 
     def on_activity_deselect( self ) -> None:
         """Handle an activity wanting to give up focus."""
@@ -1,5 +1,9 @@
 """Provides a widget for making activity type choices."""
 
+##############################################################################
+# Python imports.
+from typing import Final
+
 ##############################################################################
 # BoredAPI imports.
 from bored_api import ActivityType
@@ -10,6 +14,12 @@ from textual.app        import ComposeResult
 from textual.containers import Grid
 from textual.widgets    import Button
 
+##############################################################################
+_TYPE_BUTTONS: Final = tuple(
+    ( activity.value.capitalize(), activity.value ) for activity in ActivityType
+)
+"""The labels and IDs of the buttons for each of the activity types."""
+
 ##############################################################################
 class TypeChoices( Grid ):
     """Container widget for the type choices buttons."""
@@ -20,13 +30,13 @@ class TypeChoices( Grid ):
         Returns:
             The layout for the type choice buttons.
         """
-        yield Button( "Any", id="any" )
-        yield from ( Button(
-            activity.value.capitalize(), id=activity.value
-        ) for activity in ActivityType )
+        # pylint:disable=attribute-defined-outside-init
+        self._any_button = Button( "Any", id="any" )
+        yield self._any_button
+        yield from ( Button( label, id=button_id ) for label, button_id in _TYPE_BUTTONS )
 
     def become_focused( self ) -> None:
         """Set focus within us."""
-        self.query_one( "#any", Button ).focus()
+        self._any_button.focus()
 
 ### type_choices.py ends here